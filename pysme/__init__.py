@@ -1,10 +1,30 @@
 __version__ = "0.1.0"
 
-from . import frontend as frontend
-from . import api as api
-from . import builder as builder
-from . import runtime as runtime
-from . import routing as routing
-from . import db as db
+import typing as _typing
+
+if _typing.TYPE_CHECKING:
+    from . import frontend as frontend
+    from . import api as api
+    from . import builder as builder
+    from . import runtime as runtime
+    from . import routing as routing
+    from . import db as db
 
 __all__ = ["frontend", "api", "builder", "runtime", "routing", "db"]
+
+_SUBMODULES = frozenset(__all__)
+
+
+def __getattr__(name: str) -> _typing.Any:
+    # PEP 562: import public subpackages on first access only.
+    if name in _SUBMODULES:
+        import importlib
+
+        mod = importlib.import_module(f".{name}", __name__)
+        globals()[name] = mod
+        return mod
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
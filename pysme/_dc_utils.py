@@ -0,0 +1,41 @@
+# pyright: basic
+
+from __future__ import annotations
+from dataclasses import fields
+from typing import Any, Dict, FrozenSet, Type, TypeVar
+
+__all__ = ("make_to_dict", "field_names")
+
+T = TypeVar("T")
+
+
+def make_to_dict(cls: Type[T]) -> Type[T]:
+    """
+    Class decorator that sets ``cls.to_dict`` to a generated explicit field-copy.
+
+    Apply it above ``@dataclass``. The generated method returns
+    ``{"field": self.field, ...}`` without copying values, unlike
+    ``dataclasses.asdict``, which deep-copies recursively. It only covers the
+    fields of ``cls`` itself: a subclass that adds fields must apply
+    ``@make_to_dict`` again.
+    """
+    items = ", ".join(f"{f.name!r}: self.{f.name}" for f in fields(cls))  # type: ignore[arg-type]
+    ns: Dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", ns)
+    fn = ns["to_dict"]
+    fn.__qualname__ = f"{cls.__qualname__}.to_dict"
+    fn.__module__ = cls.__module__
+    fn.__doc__ = "Return the dataclass fields as a plain dict."
+    setattr(cls, "to_dict", fn)
+    return cls
+
+
+_FIELD_NAMES: Dict[type, FrozenSet[str]] = {}
+
+
+def field_names(cls: type) -> FrozenSet[str]:
+    """Return the dataclass field names of ``cls``, computed once per class."""
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = frozenset(f.name for f in fields(cls))
+    return names
@@ -1,10 +1,13 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet
 
-VALID_OPT_LEVELS = {"release", "debug"}
+from .._dc_utils import field_names, make_to_dict
 
+VALID_OPT_LEVELS: FrozenSet[str] = frozenset(("release", "debug"))
 
+
+@make_to_dict
 @dataclass
 class BuildConfig:
     """
@@ -20,17 +23,18 @@ class BuildConfig:
     tree_shaking: bool = False
 
     def __post_init__(self) -> None:
-        if self.optimization_level not in VALID_OPT_LEVELS:
+        # Inlined VALID_OPT_LEVELS check; two compares beat a hash for n=2.
+        level = self.optimization_level
+        if level != "release" and level != "debug":
             raise ValueError(
-                f"Invalid optimization_level={self.optimization_level!r}. "
-                f"Valid values: {VALID_OPT_LEVELS}"
+                f"Invalid optimization_level={level!r}. "
+                f"Valid values: {sorted(VALID_OPT_LEVELS)}"
             )
 
-    def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+    if TYPE_CHECKING:
+        # Generated by make_to_dict.
+        def to_dict(self) -> Dict[str, Any]: ...
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BuildConfig":
-        allowed = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in allowed}
-        return cls(**filtered)
+        return cls(**{k: data[k] for k in field_names(cls) if k in data})
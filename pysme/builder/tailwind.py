@@ -4,8 +4,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Type, TypeVar
-from copy import deepcopy
+from itertools import chain
+from typing import Any, Dict, List, Tuple, Type, TypeVar
 
 T = TypeVar("T", bound="TailwindConfig")
 
@@ -17,16 +17,25 @@ def deep_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
     """
     Recursively merge two dictionaries.
 
+    Neither input is mutated, but the result is not independent of them: only
+    dicts present on both sides are copied, and every other subtree and leaf
+    value (lists included) is shared with ``a`` or ``b``.
+
     :param a: The base dictionary of string keys and any values.
     :param b: The dictionary to merge in, with string keys and any values.
     :return: Merged dictionary with string keys and any values.
     """
-    result: Dict[str, Any] = deepcopy(a)
-    for k, v in b.items():
-        if k in result and isinstance(result[k], Dict) and isinstance(v, Dict):
-            result[k] = deep_merge(result[k], v)
-        else:
-            result[k] = deepcopy(v)
+    result: Dict[str, Any] = dict(a)
+    stack: List[Tuple[Dict[str, Any], Dict[str, Any]]] = [(result, b)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            cur = dst.get(k)
+            if isinstance(cur, dict) and isinstance(v, dict):
+                dst[k] = sub = dict(cur)
+                stack.append((sub, v))
+            else:
+                dst[k] = v
     return result
 
 
@@ -39,22 +48,35 @@ class TailwindConfig:
     def merge(self, other: TailwindConfig) -> TailwindConfig:
         """
         Merge another TailwindConfig into this one.
+
+        ``content`` and ``plugins`` are de-duplicated in first-seen order so the
+        generated tailwind.config.js is deterministic.
         """
         merged_theme: ThemeType = deep_merge(self.theme, other.theme)
-        merged_plugins: PluginList = list(set(self.plugins + other.plugins))
+        merged_plugins: PluginList = list(
+            dict.fromkeys(chain(self.plugins, other.plugins))
+        )
         return TailwindConfig(
-            content=list(set(self.content + other.content)),
+            content=list(dict.fromkeys(chain(self.content, other.content))),
             theme=merged_theme,
             plugins=merged_plugins,
         )
 
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
-        """Create a TailwindConfig from a dictionary."""
+        """
+        Create a TailwindConfig from a dictionary.
+
+        Lists and dicts in ``data`` are taken over as-is rather than copied, so
+        the caller should not mutate them afterwards.
+        """
+        content = data.get("content", ())
+        theme = data.get("theme", {})
+        plugins = data.get("plugins", ())
         return cls(
-            content=list(data.get("content", [])),
-            theme=dict(data.get("theme", {})),
-            plugins=list(data.get("plugins", [])),
+            content=content if isinstance(content, list) else list(content),
+            theme=theme if isinstance(theme, dict) else dict(theme),
+            plugins=plugins if isinstance(plugins, list) else list(plugins),
         )
 
     def to_dict(self) -> Dict[str, Any]:
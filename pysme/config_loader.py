@@ -5,8 +5,10 @@ import importlib.util
 import sys
 import os
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from types import ModuleType
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Optional, Tuple
 import json
 
 from .utils.logging import logger, configure_logging
@@ -19,6 +21,12 @@ from .utils.io_helpers import read_json, read_yaml
 DEFAULT_CONFIG_FILENAME = "pysme.config.py"
 _MODULE_NAME = "pysme_user_config"
 
+# Names read explicitly from the config module (or imported by it) rather than
+# collected into LoadedConfigs.raw.
+_RAW_EXCLUDE = frozenset(
+    ("BuildConfig", "TailwindConfig", "build_config", "tailwind_config", "debug")
+)
+
 
 @dataclass
 class LoadedConfigs:
@@ -27,6 +35,10 @@ class LoadedConfigs:
     raw: Dict[str, Any] | None = None
 
 
+# resolved path -> (st_mtime_ns, configs as loaded from the module, module `debug`)
+_CONFIG_CACHE: Dict[str, Tuple[int, LoadedConfigs, Any]] = {}
+
+
 def _bool_from_env(v: Optional[str]) -> Optional[bool]:
     if v is None:
         return None
@@ -55,39 +67,45 @@ def _json_from_env(v: Optional[str]) -> Optional[dict]:  # type: ignore
         return None
 
 
+_EnvRule = Tuple[str, str, Optional[Callable[[str], Any]]]
+
+# (env var, attribute, parser); a parser returning None leaves the attribute as is.
+_BUILD_ENV: Tuple[_EnvRule, ...] = (
+    ("PYSME_ENTRY_POINT", "entry_point", None),
+    ("PYSME_OUTPUT_DIR", "output_dir", None),
+    ("PYSME_STATIC_DIR", "static_dir", None),
+    ("PYSME_WASM_TARGET", "wasm_target", None),
+    ("PYSME_OPT_LEVEL", "optimization_level", None),
+    ("PYSME_BUNDLE_SPLITTING", "bundle_splitting", _bool_from_env),
+    ("PYSME_TREE_SHAKING", "tree_shaking", _bool_from_env),
+)
+
+_TAILWIND_ENV: Tuple[_EnvRule, ...] = (
+    ("PYSME_TAILWIND_CONTENT", "content", _list_from_env),
+    ("PYSME_TAILWIND_THEME", "theme", _json_from_env),
+    ("PYSME_TAILWIND_PLUGINS", "plugins", _list_from_env),
+)
+
+_PYSME_ENV_KEYS = frozenset(key for key, _, _ in _BUILD_ENV + _TAILWIND_ENV)
+
+
+def _apply_env_table(target: object, table: Tuple[_EnvRule, ...]) -> None:
+    env = os.environ
+    for key, attr, parser in table:
+        v = env.get(key)
+        if not v:
+            continue
+        val = parser(v) if parser else v
+        if val is not None:
+            setattr(target, attr, val)
+
+
 def _apply_env_overrides(build: BuildConfig, tailwind: TailwindConfig) -> None:
-    # Common overrides
-    if v := os.getenv("PYSME_ENTRY_POINT"):
-        build.entry_point = v
-    if v := os.getenv("PYSME_OUTPUT_DIR"):
-        build.output_dir = v
-    if v := os.getenv("PYSME_STATIC_DIR"):
-        build.static_dir = v
-    if v := os.getenv("PYSME_WASM_TARGET"):
-        build.wasm_target = v
-    if v := os.getenv("PYSME_OPT_LEVEL"):
-        build.optimization_level = v
-    if v := os.getenv("PYSME_BUNDLE_SPLITTING"):
-        b = _bool_from_env(v)
-        if b is not None:
-            build.bundle_splitting = b
-    if v := os.getenv("PYSME_TREE_SHAKING"):
-        b = _bool_from_env(v)
-        if b is not None:
-            build.tree_shaking = b
-
-    if v := os.getenv("PYSME_TAILWIND_CONTENT"):
-        content_list = _list_from_env(v)
-        if content_list is not None:
-            tailwind.content = content_list
-    if v := os.getenv("PYSME_TAILWIND_THEME"):
-        theme_obj = _json_from_env(v)
-        if theme_obj is not None:
-            tailwind.theme = theme_obj
-    if v := os.getenv("PYSME_TAILWIND_PLUGINS"):
-        plugins_list = _list_from_env(v)
-        if plugins_list is not None:
-            tailwind.plugins = plugins_list
+    # Usually no PYSME_* override is set; KeysView & set probes only our keys.
+    if not (os.environ.keys() & _PYSME_ENV_KEYS):
+        return
+    _apply_env_table(build, _BUILD_ENV)
+    _apply_env_table(tailwind, _TAILWIND_ENV)
 
 
 def _load_json_or_yaml(path: Path) -> Dict[str, Any]:
@@ -103,46 +121,21 @@ def _make_defaults() -> LoadedConfigs:
     return LoadedConfigs(build=BuildConfig(), tailwind=TailwindConfig(), raw={})
 
 
-def load_pysme_config(
-    config_path: str = DEFAULT_CONFIG_FILENAME, apply_env: bool = True
-) -> LoadedConfigs:
-    """
-    Load user config file (python file) and return typed objects.
-    If file does not exist, return defaults.
-    The user file may set:
-      - build_config (BuildConfig instance or dict)
-      - tailwind_config (TailwindConfig instance or dict)
-      - debug (bool) — will be applied to logging if present
-      - other top-level variables (collected into raw)
-    """
-    path = resolve_path(config_path)
-    if not path.exists():
-        logger.info("No %s found, using default config", config_path)
-        cfgs = _make_defaults()
-        if apply_env:
-            _apply_env_overrides(cfgs.build, cfgs.tailwind)
-        # Configure env based on env only
-        configure_logging()
-        return cfgs
+def _clone_configs(cfgs: LoadedConfigs) -> LoadedConfigs:
+    # raw is copied shallowly: user values may be locks, handles, etc. that
+    # cannot be deep-copied, so the values themselves are shared with the cache.
+    return LoadedConfigs(
+        build=replace(cfgs.build),
+        tailwind=deepcopy(cfgs.tailwind),
+        raw=dict(cfgs.raw) if cfgs.raw is not None else None,
+    )
 
-    if path.suffix.lower() in {".json", ".yml", ".yaml"}:
-        try:
-            raw_vars = _load_json_or_yaml(path)
-        except Exception as exc:
-            logger.error(
-                "Error loading JSON/YAML config %s: %s", path, exc, exc_info=True
-            )
-            return _make_defaults()
-
-        build_conf = BuildConfig.from_dict(raw_vars.get("build_config", {}))
-        tailwind_conf = TailwindConfig.from_dict(raw_vars.get("tailwind_config", {}))
-
-        if apply_env:
-            _apply_env_overrides(build_conf, tailwind_conf)
-
-        configure_logging(debug=raw_vars.get("debug", None))
-        return LoadedConfigs(build=build_conf, tailwind=tailwind_conf, raw=raw_vars)
 
+def _exec_config_module(path: Path) -> Optional[Tuple[LoadedConfigs, Any]]:
+    """
+    Execute a python config file and extract its typed configs.
+    Returns None (after logging) if the module cannot be loaded.
+    """
     # Unload previous module if present so reload works
     if _MODULE_NAME in sys.modules:
         del sys.modules[_MODULE_NAME]
@@ -150,7 +143,7 @@ def load_pysme_config(
     spec = importlib.util.spec_from_file_location(_MODULE_NAME, str(path))
     if not spec or spec.loader is None:
         logger.error("Failed to create import spec for %s", path)
-        return _make_defaults()
+        return None
 
     module = importlib.util.module_from_spec(spec)
 
@@ -162,9 +155,15 @@ def load_pysme_config(
         logger.debug(
             "Config error details: %s", exception_to_dict(err, include_trace=True)
         )
-        return _make_defaults()
+        return None
 
-    raw_vars = {k: v for k, v in vars(module).items() if not k.startswith("_")}
+    raw_vars = {
+        k: v
+        for k, v in vars(module).items()
+        if not k.startswith("_")
+        and k not in _RAW_EXCLUDE
+        and not isinstance(v, ModuleType)
+    }
 
     # build config
     bc = getattr(module, "build_config", None)
@@ -189,10 +188,77 @@ def load_pysme_config(
             "tailwind_config in pysme.config.py must be TailwindConfig or dict"
         )
 
+    cfgs = LoadedConfigs(build=build_conf, tailwind=tailwind_conf, raw=raw_vars)
+    return cfgs, getattr(module, "debug", None)
+
+
+def load_pysme_config(
+    config_path: str = DEFAULT_CONFIG_FILENAME, apply_env: bool = True
+) -> LoadedConfigs:
+    """
+    Load user config file (python file) and return typed objects.
+    If file does not exist, return defaults.
+    The user file may set:
+      - build_config (BuildConfig instance or dict)
+      - tailwind_config (TailwindConfig instance or dict)
+      - debug (bool) — will be applied to logging if present
+      - other top-level variables (collected into raw)
+
+    Python config files are cached by mtime. Each call returns fresh
+    BuildConfig/TailwindConfig objects and a fresh raw dict, but the values in
+    raw are the same objects on every call.
+    """
+    path = resolve_path(config_path)
+    # One stat(2) answers both "does it exist" and "has it changed".
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        logger.info("No %s found, using default config", config_path)
+        cfgs = _make_defaults()
+        if apply_env:
+            _apply_env_overrides(cfgs.build, cfgs.tailwind)
+        # Configure env based on env only
+        configure_logging()
+        return cfgs
+
+    if path.suffix.lower() in {".json", ".yml", ".yaml"}:
+        try:
+            raw_vars = _load_json_or_yaml(path)
+        except Exception as exc:
+            logger.error(
+                "Error loading JSON/YAML config %s: %s", path, exc, exc_info=True
+            )
+            return _make_defaults()
+
+        build_conf = BuildConfig.from_dict(raw_vars.get("build_config", {}))
+        tailwind_conf = TailwindConfig.from_dict(raw_vars.get("tailwind_config", {}))
+
+        if apply_env:
+            _apply_env_overrides(build_conf, tailwind_conf)
+
+        configure_logging(debug=raw_vars.get("debug", None))
+        raw = {k: v for k, v in raw_vars.items() if k not in _RAW_EXCLUDE}
+        return LoadedConfigs(build=build_conf, tailwind=tailwind_conf, raw=raw)
+
+    # Unchanged files are served from the cache instead of being re-executed.
+    # Callers always get a copy, since env overrides mutate the configs.
+    key = str(path)
+    mtime = st.st_mtime_ns
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None or cached[0] != mtime:
+        loaded = _exec_config_module(path)
+        if loaded is None:
+            return _make_defaults()
+        cached = (mtime, *loaded)
+        _CONFIG_CACHE[key] = cached
+
+    _, pristine, debug_flag = cached
+    cfgs = _clone_configs(pristine)
+    build_conf, tailwind_conf = cfgs.build, cfgs.tailwind
+
     if apply_env:
         _apply_env_overrides(build_conf, tailwind_conf)
 
-    debug_flag = getattr(module, "debug", None)
     if debug_flag is None:
         env_debug = _bool_from_env(os.getenv("PYSME_DEBUG"))
         if env_debug is not None:
@@ -204,10 +270,11 @@ def load_pysme_config(
         configure_logging()
 
     logger.info("Loaded config from %s", path)
-    return LoadedConfigs(build=build_conf, tailwind=tailwind_conf, raw=raw_vars)
+    return cfgs
 
 
 def reload_pysme_config(
     config_path: str = DEFAULT_CONFIG_FILENAME, apply_env: bool = True
 ) -> LoadedConfigs:
+    _CONFIG_CACHE.pop(str(resolve_path(config_path)), None)
     return load_pysme_config(config_path=config_path, apply_env=apply_env)
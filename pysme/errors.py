@@ -1,15 +1,40 @@
 # pyright: basic
 
 from __future__ import annotations
-import json
-import traceback
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, Optional, Tuple, Mapping
 from http import HTTPStatus
 from contextlib import ContextDecorator
+from enum import Enum
+from types import ModuleType
 
+# orjson is optional and slow to import; resolved on the first to_json call.
+_orjson: Optional[ModuleType] = None
+_orjson_resolved = False
 
-@dataclass
+
+def _load_orjson() -> Optional[ModuleType]:
+    global _orjson, _orjson_resolved
+    if not _orjson_resolved:
+        try:
+            import orjson
+
+            _orjson = orjson
+        except ImportError:
+            _orjson = None
+        _orjson_resolved = True
+    return _orjson
+
+
+def _json_default(o: Any) -> Any:
+    # orjson always encodes enums by value and offers no passthrough for them,
+    # so the stdlib path does the same; everything else falls back to str().
+    if isinstance(o, Enum):
+        return o.value
+    return str(o)
+
+
+@dataclass(slots=True)
 class PySmeError(Exception):
     """
     Base exception for PySme.
@@ -20,36 +45,49 @@ class PySmeError(Exception):
       - details: optional structured details for debugging (not user-facing)
       - hint: optional suggested remedy for user
       - cause: original exception (kept in __cause__)
-      - status_code: optional HTTP mapping
+      - status_code: optional HTTP mapping (fixed at construction; do not reassign)
       - safe: whether the message is safe to show to end-users
     """
 
     code: str = "PSME:GEN:000"
     message: str = "An unknown PySme error occurred"
-    details: Optional[Dict[str, Any]] = field(default_factory=dict)  # type: ignore
+    details: Optional[Dict[str, Any]] = None
     hint: Optional[str] = None
     cause: Optional[BaseException] = None
     status_code: int = HTTPStatus.INTERNAL_SERVER_ERROR
     safe: bool = False
+    _status_int: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        super().__init__(self.message)
+        # slots=True recreates the class, so zero-arg super() would bind the
+        # discarded original; call the base initialiser explicitly.
+        Exception.__init__(self, self.message)
+        self._status_int = int(self.status_code)
         if self.cause:
             self.__cause__ = self.cause
 
     def __str__(self) -> str:
         return f"{self.code} - {self.message}"
 
+    def __reduce__(self):  # type: ignore
+        # BaseException.__reduce__ only carries args and __dict__, which misses
+        # slot-backed fields; BaseException.__setstate__ restores them via setattr.
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        state["args"] = self.args
+        return type(self), (), state
+
     def to_dict(self, include_trace: bool = False) -> Dict[str, Any]:
         """Return a serializable dict representation. Useful for logging / HTTP responses."""
         d: Dict[str, Any] = {
             "code": self.code,
-            "message": self.message if self.safe else str(self.message),
+            "message": self.message,
             "hint": self.hint,
-            "status_code": int(self.status_code),
+            "status_code": self._status_int,
             "details": self.details or {},
         }
         if include_trace and self.__cause__:
+            import traceback
+
             d["cause_type"] = type(self.__cause__).__name__
             d["traceback"] = traceback.format_exception(
                 type(self.__cause__), self.__cause__, self.__cause__.__traceback__
@@ -57,11 +95,33 @@ class PySmeError(Exception):
         return d
 
     def to_json(self, **kwargs) -> str:  # type: ignore
-        return json.dumps(
-            self.to_dict(include_trace=kwargs.pop("include_trace", False)),  # type: ignore
-            default=str,
-            **kwargs,  # type: ignore
-        )
+        """
+        Serialize to_dict() as JSON.
+
+        Uses orjson when installed and no json.dumps options are passed;
+        otherwise (or if orjson rejects the payload) falls back to json.dumps.
+        Both paths encode the same values: enums by value, datetimes,
+        dataclasses and other unknown types via str(). The orjson output is
+        compact and not ASCII-escaped, and it writes NaN/Infinity as null.
+        """
+        d = self.to_dict(include_trace=kwargs.pop("include_trace", False))
+        orjson = _load_orjson() if not kwargs else None
+        if orjson is not None:
+            try:
+                encoded: bytes = orjson.dumps(
+                    d,
+                    default=_json_default,
+                    option=orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS,
+                )
+                return encoded.decode()
+            except orjson.JSONEncodeError:
+                pass
+
+        import json
+
+        return json.dumps(d, default=_json_default, **kwargs)
 
 
 # ----------------------------------------------------------------------
@@ -69,7 +129,7 @@ class PySmeError(Exception):
 # -----------------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigError(PySmeError):
     code: str = "PSME:CFG:001"
     message: str = "Configuration error"
@@ -77,7 +137,7 @@ class ConfigError(PySmeError):
     safe: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigLoadError(ConfigError):
     code: str = "PSME:CFG:002"
     message: str = "Failed to load configuration file"
@@ -86,7 +146,7 @@ class ConfigLoadError(ConfigError):
     safe: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigValidationError(ConfigError):
     code: str = "PSME:CFG:003"
     message: str = "Configuration validation failed"
@@ -96,7 +156,7 @@ class ConfigValidationError(ConfigError):
     safe: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildError(PySmeError):
     code: str = "PSME:BLD:001"
     message: str = "Build/compile error"
@@ -106,7 +166,7 @@ class BuildError(PySmeError):
     safe: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ParserError(PySmeError):
     code: str = "PSME:PAR:001"
     message: str = "Parser error"
@@ -116,7 +176,7 @@ class ParserError(PySmeError):
     safe: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class PysmeRuntimeError(PySmeError):
     code: str = "PSME:RTE:001"
     message: str = "Runtime error in component"
@@ -125,7 +185,7 @@ class PysmeRuntimeError(PySmeError):
     safe: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class NotFoundError(PySmeError):
     code: str = "PSME:API:404"
     message: str = "Not found"
@@ -133,7 +193,7 @@ class NotFoundError(PySmeError):
     safe: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthError(PySmeError):
     code: str = "PSME:API:401"
     message: str = "Authentication / Authorization error"
@@ -141,7 +201,7 @@ class AuthError(PySmeError):
     safe: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError(PySmeError):
     code: str = "PSME:VAL:001"
     message: str = "Validation error"
@@ -150,7 +210,7 @@ class ValidationError(PySmeError):
     safe: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseError(PySmeError):
     code: str = "PSME:DB:001"
     message: str = "Database error"
@@ -182,6 +242,8 @@ def exception_to_dict(
     }
 
     if include_trace:
+        import traceback
+
         d["traceback"] = traceback.format_exception(type(exc), exc, exc.__traceback__)
     return d
 
@@ -195,7 +257,7 @@ def map_exception_to_http_response(
     """
     if isinstance(exc, PySmeError):
         body = exc.to_dict(include_trace=include_trace)
-        status = int(exc.status_code or HTTPStatus.INTERNAL_SERVER_ERROR)
+        status = exc._status_int or int(HTTPStatus.INTERNAL_SERVER_ERROR)
         return status, body
 
     body = {
@@ -204,6 +266,8 @@ def map_exception_to_http_response(
         "type": type(exc).__name__,
     }
     if include_trace:
+        import traceback
+
         body["traceback"] = "".join(
             traceback.format_exception(type(exc), exc, exc.__traceback__)
         )
@@ -232,21 +296,25 @@ class wrap_exception(ContextDecorator):
     def __enter__(self):
         return None
 
-    def __exit__(self, exc_val, exc_type, exc_tb):
+    def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_val is None:
             return False
         if isinstance(exc_val, PySmeError):
-            if self.kwargs:
-                exc_val.details = {
-                    **(exc_val.details or {}),
-                    **self.kwargs.get("details", {}),
-                }
+            extra = self.kwargs.get("details")
+            if extra:
+                # Build a new dict: the error's details may be borrowed from a
+                # caller or from another wrapper's kwargs.
+                exc_val.details = (
+                    {**exc_val.details, **extra} if exc_val.details else dict(extra)
+                )
             return False
         msg = self.message or getattr(exc_val, "message", str(exc_val))
-        wrapped = self.cls(
-            message=msg, details=self.kwargs.get("details", {}), cause=exc_val
-        )
-        raise wrapped from exc_val
+        init: Dict[str, Any] = {"message": msg, "cause": exc_val}
+        details = self.kwargs.get("details")
+        if details is not None:
+            # Otherwise leave details to the class default (None on the base error).
+            init["details"] = details
+        raise self.cls(**init) from exc_val
 
 
 # --------------------------------------
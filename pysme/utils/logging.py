@@ -107,7 +107,9 @@ def configure_logging(
 
 
 def get_logger(name: str = "pysme") -> logging.Logger:
-    configure_logging()
+    # Only configure on first use; call configure_logging() to reconfigure.
+    if not _is_configured:
+        configure_logging()
     return logging.getLogger(name)
 
 
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from pysme.builder.config import BuildConfig
+
+
+@dataclass
+class _ExtendedBuild(BuildConfig):
+    extra: int = 0
+
+
+def test_from_dict_ignores_unknown_keys() -> None:
+    cfg = BuildConfig.from_dict({"output_dir": "out", "unknown": 1})
+    assert cfg.output_dir == "out"
+
+
+def test_from_dict_uses_subclass_fields() -> None:
+    cfg = _ExtendedBuild.from_dict({"extra": 5, "output_dir": "out"})
+    assert cfg.extra == 5
+    assert cfg.output_dir == "out"
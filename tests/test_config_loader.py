@@ -0,0 +1,62 @@
+import threading
+from pathlib import Path
+
+from pysme.config_loader import load_pysme_config
+
+_CONFIG = """
+build_config = {"output_dir": "out"}
+tailwind_config = {"plugins": ["forms"]}
+counter = []
+"""
+
+_LOCK_CONFIG = """
+import threading
+
+LOCK = threading.Lock()
+"""
+
+
+def _write_config(tmp_path: Path) -> str:
+    path = tmp_path / "pysme.config.py"
+    path.write_text(_CONFIG, encoding="utf-8")
+    return str(path)
+
+
+def test_cached_load_returns_independent_copies(tmp_path: Path) -> None:
+    config_path = _write_config(tmp_path)
+
+    first = load_pysme_config(config_path, apply_env=False)
+    first.build.output_dir = "changed"
+    first.tailwind.plugins.append("typography")
+    assert first.raw is not None
+    first.raw["added"] = 1
+
+    second = load_pysme_config(config_path, apply_env=False)
+    assert second.build.output_dir == "out"
+    assert second.tailwind.plugins == ["forms"]
+    assert second.raw is not None
+    assert "added" not in second.raw
+    # raw values are shared with the cache; only the container is fresh.
+    assert second.raw["counter"] is first.raw["counter"]
+
+
+def test_raw_values_need_not_be_copyable(tmp_path: Path) -> None:
+    path = tmp_path / "pysme.config.py"
+    path.write_text(_LOCK_CONFIG, encoding="utf-8")
+
+    for _ in range(2):
+        cfgs = load_pysme_config(str(path), apply_env=False)
+        assert cfgs.raw is not None
+        assert isinstance(cfgs.raw["LOCK"], type(threading.Lock()))
+
+
+def test_json_raw_matches_python_raw(tmp_path: Path) -> None:
+    path = tmp_path / "pysme.config.json"
+    path.write_text(
+        '{"build_config": {"output_dir": "out"}, "debug": false, "extra": 1}',
+        encoding="utf-8",
+    )
+
+    cfgs = load_pysme_config(str(path), apply_env=False)
+    assert cfgs.build.output_dir == "out"
+    assert cfgs.raw == {"extra": 1}
@@ -0,0 +1,41 @@
+from dataclasses import asdict, dataclass
+from typing import Any, List
+
+from pysme._dc_utils import field_names, make_to_dict
+
+_registry: List[type] = []
+
+
+@make_to_dict
+@dataclass
+class _Base:
+    a: int = 1
+    b: str = "b"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _registry.append(cls)
+
+
+@make_to_dict
+@dataclass
+class _Child(_Base):
+    c: int = 3
+
+
+def test_to_dict_matches_asdict() -> None:
+    obj = _Base(a=2)
+    assert obj.to_dict() == asdict(obj)
+
+
+def test_redecorated_subclass_includes_own_fields() -> None:
+    assert _Child(c=7).to_dict() == {"a": 1, "b": "b", "c": 7}
+    assert "c" not in _Base().to_dict()
+
+
+def test_existing_init_subclass_is_untouched() -> None:
+    assert _registry == [_Child]
+
+
+def test_field_names() -> None:
+    assert field_names(_Child) == {"a", "b", "c"}
@@ -0,0 +1,104 @@
+import enum
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+
+import pytest
+
+from pysme import errors
+from pysme.errors import (
+    BuildError,
+    ConfigLoadError,
+    ConfigValidationError,
+    NotFoundError,
+    config_validation_error,
+    map_exception_to_http_response,
+    wrap_exception,
+)
+
+
+def test_http_status_matches_body() -> None:
+    status, body = map_exception_to_http_response(NotFoundError())
+    assert status == 404
+    assert body["status_code"] == status
+
+
+def test_to_json_round_trips() -> None:
+    err = NotFoundError(details={1: "int key", "big": 2**70})
+    assert json.loads(err.to_json()) == {
+        "code": "PSME:API:404",
+        "message": "Not found",
+        "hint": None,
+        "status_code": 404,
+        "details": {"1": "int key", "big": 2**70},
+    }
+    assert json.loads(err.to_json(indent=2)) == json.loads(err.to_json())
+
+
+class _Color(enum.Enum):
+    A = "a"
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+def test_to_json_paths_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    err = NotFoundError(
+        details={
+            "t": datetime(2024, 1, 1),
+            "d": date(2024, 1, 2),
+            "c": _Color.A,
+            "p": _Point(1),
+        }
+    )
+    fast = json.loads(err.to_json())
+    monkeypatch.setattr(errors, "_orjson", None)
+    monkeypatch.setattr(errors, "_orjson_resolved", True)
+    stdlib = json.loads(err.to_json())
+
+    assert fast == stdlib == json.loads(err.to_json(indent=2))
+    assert stdlib["details"] == {
+        "t": "2024-01-01 00:00:00",
+        "d": "2024-01-02",
+        "c": "a",
+        "p": "_Point(x=1)",
+    }
+
+
+def test_wrap_exception_does_not_mutate_inner_details() -> None:
+    deco = wrap_exception(ConfigLoadError, details={"path": "p"})
+
+    @deco
+    def load() -> None:
+        raise ValueError("boom")
+
+    for step in range(2):
+        with pytest.raises(ConfigLoadError) as info:
+            with wrap_exception(BuildError, details={"step": step}):
+                load()
+        assert info.value.details == {"path": "p", "step": step}
+
+    assert deco.kwargs == {"details": {"path": "p"}}
+
+
+def test_config_validation_error_keeps_caller_dict() -> None:
+    errors = {"output_dir": "required"}
+    with pytest.raises(ConfigValidationError):
+        with wrap_exception(BuildError, details={"step": 1}):
+            raise config_validation_error(errors)
+    assert errors == {"output_dir": "required"}
+
+
+def test_wrap_exception_without_details() -> None:
+    with pytest.raises(ConfigLoadError) as info:
+        with wrap_exception(ConfigLoadError):
+            raise ValueError("boom")
+    assert info.value.details is None
+    assert info.value.to_dict()["details"] == {}
+
+    with pytest.raises(BuildError) as build_info:
+        with wrap_exception(BuildError):
+            raise ValueError("boom")
+    assert build_info.value.details == {}
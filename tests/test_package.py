@@ -0,0 +1,13 @@
+import pysme
+
+
+def test_dir_lists_loaded_submodule_once() -> None:
+    assert pysme.builder is not None
+    assert dir(pysme).count("builder") == 1
+    assert "db" in dir(pysme)
+
+
+def test_namespace_has_no_helper_imports() -> None:
+    names = dir(pysme)
+    for leaked in ("importlib", "Any", "TYPE_CHECKING"):
+        assert leaked not in names
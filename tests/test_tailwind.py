@@ -0,0 +1,45 @@
+import copy
+
+from pysme.builder.tailwind import TailwindConfig, deep_merge
+
+
+def test_deep_merge_merges_nested_dicts() -> None:
+    a = {"extend": {"colors": {"primary": "#000", "muted": "#999"}}, "x": 1}
+    b = {"extend": {"colors": {"primary": "#fff"}, "spacing": {"1": "4px"}}}
+
+    assert deep_merge(a, b) == {
+        "extend": {
+            "colors": {"primary": "#fff", "muted": "#999"},
+            "spacing": {"1": "4px"},
+        },
+        "x": 1,
+    }
+
+
+def test_deep_merge_non_dict_value_replaces() -> None:
+    assert deep_merge({"k": {"n": 1}}, {"k": "v"}) == {"k": "v"}
+    assert deep_merge({"k": "v"}, {"k": {"n": 1}}) == {"k": {"n": 1}}
+
+
+def test_deep_merge_leaves_inputs_untouched() -> None:
+    a = {"extend": {"colors": {"primary": "#000"}}}
+    b = {"extend": {"colors": {"primary": "#fff"}}}
+    a_before, b_before = copy.deepcopy(a), copy.deepcopy(b)
+
+    deep_merge(a, b)
+    assert a == a_before
+    assert b == b_before
+
+
+def test_deep_merge_shares_untouched_values() -> None:
+    fonts = ["Inter", "sans-serif"]
+    merged = deep_merge({"fontFamily": {"sans": fonts}}, {"colors": {}})
+    assert merged["fontFamily"]["sans"] is fonts
+
+
+def test_merge_dedupes_in_order() -> None:
+    merged = TailwindConfig(content=["a"], plugins=["x", "y"]).merge(
+        TailwindConfig(content=["b", "a"], plugins=["y", "z"])
+    )
+    assert merged.content == ["a", "b"]
+    assert merged.plugins == ["x", "y", "z"]